@@ -1,6 +1,52 @@
+import html
+import re
 import streamlit as st
 from ui_components import render_developer_info
 
+# Compiled once at import; the analysis section counts matches without
+# materializing intermediate lists.
+_SENT_RE = re.compile(r'[^.!?]+[.!?]')
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+@st.cache_data
+def top_words(text: str, k: int = 10) -> list:
+    """
+    Most common k words in the document. Cached on the text so repeat
+    clicks and unrelated widget reruns skip the full tokenize+Counter
+    pass.
+    """
+    from collections import Counter
+    return Counter(_WORD_RE.findall(text.lower())).most_common(k)
+
+
+@st.cache_data
+def document_stats(text: str) -> dict:
+    """All whole-document counts in one cached pass over the text."""
+    words = text.split()
+    return {
+        "chars": len(text),
+        "words": len(words),
+        "total_word_chars": sum(map(len, words)),
+        "lines": len(text.splitlines()),
+        "paragraphs": sum(1 for p in text.split('\n\n') if p.strip()),
+    }
+
+
+@st.cache_data
+def split_lines(text: str) -> list:
+    return text.splitlines()
+
+
+@st.cache_data
+def split_paragraphs(text: str) -> list:
+    return [p.strip() for p in text.split('\n\n') if p.strip()]
+
+
+# Line-by-line view renders at most this many lines per page; thousands of
+# rows in one pass would dwarf every other cost on the page.
+LINES_PER_PAGE = 200
+
 
 st.set_page_config(
     page_title="View Document", 
@@ -64,16 +110,20 @@ document_text = st.session_state.get("document_text", None)
 document_name = st.session_state.get("document_name", "Uploaded Document")
 
 if document_text is not None:
+    # One cached pass covers every count below; the per-tab splits are
+    # cached separately and only materialize for tabs actually shown.
+    stats = document_stats(document_text)
+    word_count = stats["words"]
+
     # Create two columns for stats and actions
     col1, col2 = st.columns([2, 1])
-    
+
     with col1:
         # Calculate stats outside f-string
-        char_count = len(document_text)
-        word_count = len(document_text.split())
-        line_count = len(document_text.splitlines())
-        para_count = len([p for p in document_text.split('\n\n') if p.strip()])
-        
+        char_count = stats["chars"]
+        line_count = stats["lines"]
+        para_count = stats["paragraphs"]
+
         st.markdown(f"""
             <div class="document-stats">
                 <h3 style="margin-top: 0;">📊 Document Statistics</h3>
@@ -122,16 +172,9 @@ if document_text is not None:
         
         # Word frequency analysis
         if st.button("📊 Show Word Frequency", use_container_width=True):
-            from collections import Counter
-            import re
-            
-            # Simple word tokenization
-            words = re.findall(r'\b\w+\b', document_text.lower())
-            word_freq = Counter(words)
-            
             # Get top 10 most common words
             st.markdown("### 🔝 Top 10 Most Common Words")
-            for word, count in word_freq.most_common(10):
+            for word, count in top_words(document_text):
                 st.write(f"**{word}**: {count} times")
     
     # Main document display
@@ -150,14 +193,26 @@ if document_text is not None:
         )
     
     with tab2:
-        lines = document_text.splitlines()
+        lines = split_lines(document_text)
         st.markdown(f"*Total lines: {len(lines)}*")
-        for i, line in enumerate(lines, 1):
-            if line.strip():  # Only show non-empty lines
-                st.markdown(f"**Line {i}:** {line}")
-    
+        if len(lines) > LINES_PER_PAGE:
+            n_pages = (len(lines) + LINES_PER_PAGE - 1) // LINES_PER_PAGE
+            page = st.number_input("Page", min_value=1, max_value=n_pages, value=1)
+            start = (page - 1) * LINES_PER_PAGE
+        else:
+            start = 0
+        # One render call for the whole page; a markdown call per line
+        # means a component round-trip per line, which dominates render
+        # time long before Python does.
+        page_html = "<br>".join(
+            f"<b>Line {i}:</b> {html.escape(line)}"
+            for i, line in enumerate(lines[start:start + LINES_PER_PAGE], start + 1)
+            if line.strip()  # Only show non-empty lines
+        )
+        st.markdown(page_html, unsafe_allow_html=True)
+
     with tab3:
-        paragraphs = [p.strip() for p in document_text.split('\n\n') if p.strip()]
+        paragraphs = split_paragraphs(document_text)
         st.markdown(f"*Total paragraphs: {len(paragraphs)}*")
         for i, para in enumerate(paragraphs, 1):
             with st.expander(f"Paragraph {i} ({len(para.split())} words)"):
@@ -170,15 +225,15 @@ if document_text is not None:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        avg_word_length = sum(len(word) for word in document_text.split()) / len(document_text.split())
+        avg_word_length = stats["total_word_chars"] / word_count
         st.metric("Average Word Length", f"{avg_word_length:.2f} chars")
-    
+
     with col2:
-        sentences = len([s for s in document_text.split('.') if s.strip()])
+        sentences = sum(1 for _ in _SENT_RE.finditer(document_text))
         st.metric("Estimated Sentences", sentences)
-    
+
     with col3:
-        avg_words_per_sentence = len(document_text.split()) / max(sentences, 1)
+        avg_words_per_sentence = word_count / max(sentences, 1)
         st.metric("Avg Words/Sentence", f"{avg_words_per_sentence:.1f}")
 
 else:
@@ -2,39 +2,64 @@ import streamlit as st
 from rag_engine import SimpleRAG
 from ui_components import render_query_results
 
+EXAMPLE_QUESTIONS = [
+    "What is the main topic of this document?",
+    "Who is the main person discussed?",
+    "What are the key achievements mentioned?",
+    "When did important events occur?",
+]
 
-def handle_query_interface(rag: SimpleRAG | None):
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_query(query: str, doc_hash: str, top_k: int, _rag: SimpleRAG):
     """
-    Enhanced query interface with better UX and visual feedback.
+    Run the retrieval pass and derive the response, cached across reruns.
+    Keyed on (query, doc_hash, top_k); the engine itself is unhashable, so
+    _rag is excluded from the key and doc_hash stands in for the document
+    and chunking configuration. Repeat queries — including reruns caused
+    by unrelated widgets — return from the cache without touching TF-IDF.
     """
-    
+    return _rag.respond_and_search(query, top_k=top_k)
+
+
+@st.fragment
+def _query_panel(rag: SimpleRAG | None):
+    """
+    The interactive query panel. Decorated with st.fragment so typing a
+    question or pressing Search reruns only this panel — the upload
+    column, chunking sidebar and engine build above it are untouched.
+    """
+
     st.markdown("### 🤔 Ask a Question")
-    
-    # Create columns for query input and button
-    col1, col2 = st.columns([4, 1])
-    
-    with col1:
-        query = st.text_input(
-            "Your question:",
-            placeholder="e.g., What is the main idea? Who won the Fields Medal?",
-            label_visibility="collapsed"
-        )
-    
-    with col2:
-        search_button = st.button("🔍 Search", use_container_width=True)
+
+    # The form batches widget state: intermediate edits to the text input
+    # are sent to the server only when Search (or Enter) is pressed, so
+    # the retrieval path runs once per intentional query instead of on
+    # every input rerun.
+    with st.form("rag_query", clear_on_submit=False, border=False):
+        col1, col2 = st.columns([4, 1])
+
+        with col1:
+            query = st.text_input(
+                "Your question:",
+                placeholder="e.g., What is the main idea? Who won the Fields Medal?",
+                label_visibility="collapsed"
+            )
+
+        with col2:
+            search_button = st.form_submit_button("🔍 Search", use_container_width=True)
     
     # Add example questions
     if not query:
         st.markdown("#### 💭 Example Questions")
-        example_questions = [
-            "What is the main topic of this document?",
-            "Who is the main person discussed?",
-            "What are the key achievements mentioned?",
-            "When did important events occur?",
-        ]
-        
+        if rag is not None:
+            # Vectorize all suggestions in one batched transform so a
+            # click on any of them skips query vectorization; no-op once
+            # the cache is seeded.
+            rag.warm_queries(EXAMPLE_QUESTIONS)
+
         cols = st.columns(2)
-        for idx, eq in enumerate(example_questions):
+        for idx, eq in enumerate(EXAMPLE_QUESTIONS):
             with cols[idx % 2]:
                 if st.button(f"💡 {eq}", key=f"example_{idx}", use_container_width=True):
                     query = eq
@@ -44,18 +69,34 @@ def handle_query_interface(rag: SimpleRAG | None):
     if (query and rag) or (search_button and query and rag):
         with st.spinner("🔎 Searching through document chunks..."):
             try:
-                response = rag.generate_response(query)
-                results = rag.search_with_scores(query, top_k=3)
+                # Retrieve once and derive the response from the same
+                # results; generate_response would run a second full
+                # vectorize+similarity pass. The cached wrapper keys on
+                # the engine's doc_hash so a new document or chunking
+                # config invalidates stored results.
+                doc_hash = getattr(rag, "doc_hash", "")
+                state_key = (query, doc_hash)
+                if st.session_state.get("_last_query_key") == state_key:
+                    # Spurious rerun with the same query: skip even the
+                    # cache_data lookup and reuse this session's result.
+                    response, results = st.session_state["_last_query_result"]
+                else:
+                    response, results = _cached_query(query, doc_hash, 3, rag)
+                    st.session_state["_last_query_key"] = state_key
+                    st.session_state["_last_query_result"] = (response, results)
                 
                 # Display results using enhanced UI
                 render_query_results(response, results)
                 
                 # Add download option for results
                 st.markdown("---")
-                result_text = f"Query: {query}\n\nResponse: {response}\n\n"
-                result_text += "Retrieved Chunks:\n"
-                for i, (chunk, score) in enumerate(results, 1):
-                    result_text += f"\nChunk {i} (score: {score:.4f}):\n{chunk}\n"
+                # One join instead of growing the string chunk by chunk.
+                parts = [f"Query: {query}\n\nResponse: {response}\n\nRetrieved Chunks:\n"]
+                parts.extend(
+                    f"\nChunk {i} (score: {score:.4f}):\n{chunk}\n"
+                    for i, (chunk, score) in enumerate(results, 1)
+                )
+                result_text = "".join(parts)
                 
                 st.download_button(
                     label="📥 Download Results",
@@ -69,8 +110,16 @@ def handle_query_interface(rag: SimpleRAG | None):
     
     elif query and not rag:
         st.warning("⚠️ Please upload a document first before asking questions.")
-    
-    # Add helpful tips
+
+
+def handle_query_interface(rag: SimpleRAG | None):
+    """
+    Enhanced query interface with better UX and visual feedback.
+    """
+    _query_panel(rag)
+
+    # Static tips live outside the fragment; they never change, so the
+    # per-keystroke fragment reruns skip them.
     with st.expander("💡 Tips for Better Results"):
         st.markdown("""
         **How to get the best answers:**
@@ -15,7 +15,12 @@ from rag_builder import build_rag_engine
 init_session_state()
 
 # ===== HANDLE NLTK AVAILABILITY =====
-_nltk_available = ensure_nltk_punkt()
+# Probe (and possibly download) the tokenizer only when the NLTK strategy
+# is actually selected; every other strategy skips the probe entirely.
+if st.session_state.chunking_choice == "nltk":
+    _nltk_available = ensure_nltk_punkt()
+else:
+    _nltk_available = True
 
 # ===== UI =====
 rag_question_answering()
@@ -40,6 +45,7 @@ with col2:
         if st.button("🔄 Clear Document", use_container_width=True):
             st.session_state.document_text = None
             st.session_state.document_name = None
+            st.session_state.document_word_count = None
             st.rerun()
     else:
         st.markdown("### ℹ️ Quick Start")
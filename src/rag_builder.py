@@ -1,6 +1,82 @@
+import hashlib
+from pathlib import Path
 import streamlit as st
 from rag_engine import SimpleRAG
 
+# Fitted indexes are persisted here so a fresh Streamlit worker can load
+# them from disk instead of re-chunking and refitting.
+_CACHE_DIR = Path(__file__).parent / ".rag_cache"
+
+
+@st.cache_resource(max_entries=4)
+def _document_vocabulary(text_hash: str, _document_text: str) -> dict:
+    """
+    Term -> column mapping for a document, cached independently of the
+    chunking parameters. Re-chunking the same document (e.g. tweaking
+    overlap) reuses it, so only the IDF pass runs on refit.
+    """
+    return SimpleRAG.build_vocabulary(_document_text)
+
+
+@st.cache_resource(max_entries=4)
+def _build_cached_rag(text_hash: str, chunking_choice: str, chunk_size: int,
+                      overlap: int, window_size: int, step_size: int,
+                      recursive_chunk_size: int, recursive_overlap: int,
+                      semantic_buffer_size: int, semantic_threshold: float,
+                      hierarchical_max_size: int, hierarchical_preserve: bool,
+                      nltk_available: bool, _document_text: str) -> SimpleRAG:
+    """
+    Construct and fit a SimpleRAG instance, cached across Streamlit reruns.
+    The cache key is the document content hash plus all chunking parameters;
+    _document_text is excluded from hashing (leading underscore) since
+    text_hash already stands in for it. A second, on-disk cache layer lets
+    cold worker starts load a previously fitted index instead of refitting.
+    """
+    sig = hashlib.blake2b(
+        repr((text_hash, chunking_choice, chunk_size, overlap, window_size,
+              step_size, recursive_chunk_size, recursive_overlap,
+              semantic_buffer_size, semantic_threshold, hierarchical_max_size,
+              hierarchical_preserve, nltk_available)).encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+    cache_path = _CACHE_DIR / f"{sig}.joblib"
+    if cache_path.exists():
+        try:
+            rag = SimpleRAG.load(cache_path)
+            rag.doc_hash = sig
+            return rag
+        except Exception:
+            # Stale or corrupt cache entry: fall through and rebuild.
+            pass
+    rag = SimpleRAG(
+        chunking_method=chunking_choice,
+        chunk_size=chunk_size,
+        overlap=overlap,
+        window_size=window_size,
+        step_size=step_size,
+        recursive_chunk_size=recursive_chunk_size,
+        recursive_overlap=recursive_overlap,
+        semantic_buffer_size=semantic_buffer_size,
+        semantic_threshold=semantic_threshold,
+        hierarchical_max_size=hierarchical_max_size,
+        hierarchical_preserve=hierarchical_preserve,
+        vocabulary=_document_vocabulary(text_hash, _document_text),
+        _nltk_available=nltk_available
+    )
+    rag.add_documents(_document_text)
+    # Stable signature for downstream caches (e.g. the query-result cache
+    # in query_handler) to key on; covers the document and every chunking
+    # parameter, so a new upload or reconfiguration invalidates them.
+    rag.doc_hash = sig
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        rag.save(cache_path)
+    except Exception:
+        # Persistence is best-effort; a read-only filesystem just means the
+        # next cold start refits.
+        pass
+    return rag
+
 
 def build_rag_engine(document_text: str | None, chunking_choice: str, chunk_size: int, 
                     overlap: int, window_size: int, step_size: int, 
@@ -34,22 +110,29 @@ def build_rag_engine(document_text: str | None, chunking_choice: str, chunk_size
         return None
 
     try:
-        rag = SimpleRAG(
-            chunking_method=chunking_choice,
-            chunk_size=chunk_size,
-            overlap=overlap,
-            window_size=window_size,
-            step_size=step_size,
-            recursive_chunk_size=recursive_chunk_size,
-            recursive_overlap=recursive_overlap,
-            semantic_buffer_size=semantic_buffer_size,
-            semantic_threshold=semantic_threshold,
-            hierarchical_max_size=hierarchical_max_size,
-            hierarchical_preserve=hierarchical_preserve,
-            _nltk_available=nltk_available
+        # blake2b is fast on short inputs and available in the stdlib;
+        # the hash keys the cache so reruns that only touch unrelated
+        # widgets reuse the already-fitted engine.
+        text_hash = hashlib.blake2b(
+            document_text.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        rag = _build_cached_rag(
+            text_hash,
+            chunking_choice,
+            chunk_size,
+            overlap,
+            window_size,
+            step_size,
+            recursive_chunk_size,
+            recursive_overlap,
+            semantic_buffer_size,
+            semantic_threshold,
+            hierarchical_max_size,
+            hierarchical_preserve,
+            nltk_available,
+            _document_text=document_text
         )
-        rag.add_documents(document_text)
-        
+
         # Display success message with chunk count
         st.info(f"✅ Processed into **{len(rag.chunks)} chunks** using **{chunking_choice}** strategy.")
         
@@ -1,59 +1,44 @@
 import streamlit as st
-from io import StringIO
 
-
-def init_session_state():
-    """
-    Initialize default values in st.session_state if not already set.
-    This function should be called at the start of the application to ensure
-    all required session state variables exist with appropriate default values.
-    """
-    
+# Defaults for every session-state key the app relies on, grouped in one
+# table so initialization is a single loop instead of a per-key
+# membership check and conditional assignment.
+_SESSION_DEFAULTS = {
     # Document-related state
-    if "document_text" not in st.session_state:
-        st.session_state.document_text = None
-    
-    if "document_name" not in st.session_state:
-        st.session_state.document_name = None
-
+    "document_text": None,
+    "document_name": None,
+    # Word count computed once at upload so status renders don't re-split
+    # the whole document on every rerun.
+    "document_word_count": None,
     # Chunking strategy selection
-    if "chunking_choice" not in st.session_state:
-        st.session_state.chunking_choice = "fixed"
-
+    "chunking_choice": "fixed",
     # Fixed-size chunking parameters
-    if "chunk_size" not in st.session_state:
-        st.session_state.chunk_size = 10
-
-    if "overlap" not in st.session_state:
-        st.session_state.overlap = 2
-    
+    "chunk_size": 10,
+    "overlap": 2,
     # Sliding window chunking parameters
-    if "window_size" not in st.session_state:
-        st.session_state.window_size = 20
-    
-    if "step_size" not in st.session_state:
-        st.session_state.step_size = 10
-    
+    "window_size": 20,
+    "step_size": 10,
     # Recursive chunking parameters
-    if "recursive_chunk_size" not in st.session_state:
-        st.session_state.recursive_chunk_size = 500
-    
-    if "recursive_overlap" not in st.session_state:
-        st.session_state.recursive_overlap = 50
-    
+    "recursive_chunk_size": 500,
+    "recursive_overlap": 50,
     # Semantic chunking parameters
-    if "semantic_buffer_size" not in st.session_state:
-        st.session_state.semantic_buffer_size = 1
-    
-    if "semantic_threshold" not in st.session_state:
-        st.session_state.semantic_threshold = 0.5
-    
+    "semantic_buffer_size": 1,
+    "semantic_threshold": 0.5,
     # Hierarchical chunking parameters
-    if "hierarchical_max_size" not in st.session_state:
-        st.session_state.hierarchical_max_size = 1000
-    
-    if "hierarchical_preserve" not in st.session_state:
-        st.session_state.hierarchical_preserve = True
+    "hierarchical_max_size": 1000,
+    "hierarchical_preserve": True,
+}
+
+
+def init_session_state():
+    """
+    Initialize default values in st.session_state if not already set.
+    This function should be called at the start of the application to ensure
+    all required session state variables exist with appropriate default values.
+    """
+    for key, default in _SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = default
 
 
 def handle_uploaded_file(uploaded_file):
@@ -71,13 +56,15 @@ def handle_uploaded_file(uploaded_file):
     """
     if uploaded_file is not None:
         try:
-            # Read the uploaded file content
-            stringio = StringIO(uploaded_file.getvalue().decode("utf-8"))
-            document_content = stringio.read()
+            # Decode the upload in one step; routing the decoded string
+            # through StringIO just made an extra full copy of the document.
+            document_content = uploaded_file.getvalue().decode("utf-8", errors="replace")
             
-            # Update session state
+            # Update session state; the word count is computed here once
+            # instead of on every status render.
             st.session_state.document_text = document_content
             st.session_state.document_name = uploaded_file.name
+            st.session_state.document_word_count = len(document_content.split())
             
             # Show success message
             st.success(f"✅ Uploaded: `{uploaded_file.name}`")
@@ -86,4 +73,5 @@ def handle_uploaded_file(uploaded_file):
             st.error(f"❌ Error reading file: {str(e)}")
             st.session_state.document_text = None
             st.session_state.document_name = None
+            st.session_state.document_word_count = None
             
\ No newline at end of file
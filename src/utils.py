@@ -1,21 +1,37 @@
-import streamlit as st
+from functools import cache
 
+try:
+    import nltk
+except ImportError:
+    nltk = None
 
+
+@cache
 def ensure_nltk_punkt() -> bool:
     """
     Checks if NLTK 'punkt' tokenizer is available.
     If not, attempts to download it with a Streamlit spinner.
     Returns True if available (after download or already present), False otherwise.
+    Cached per process: nltk.data.find walks every directory on
+    nltk.data.path, which is too slow to repeat on each rerun. streamlit
+    is imported only on the download path so non-UI consumers of this
+    module skip its heavy import entirely.
     """
+    if nltk is None:
+        return False
     try:
-        import nltk
-        # Check if 'punkt' is already available
-        if nltk.data.find('tokenizers/punkt'):
-            return True
-        else:
+        # find() raises LookupError rather than returning something falsy,
+        # so the download path lives in the handler; the old truthiness
+        # check could never reach it.
+        nltk.data.find('tokenizers/punkt')
+        return True
+    except LookupError:
+        try:
+            import streamlit as st
             with st.spinner("Downloading NLTK 'punkt' tokenizer (one-time)..."):
                 nltk.download('punkt', quiet=True)
             return True
+        except Exception:
+            return False
     except Exception:
         return False
-    
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+Smoke test for the About page.
+
+The page is static content, so the only interesting failure mode is the
+module not importing or render_about() raising — exactly what a
+name-shadowing bug here once caused. AppTest executes the page script
+headlessly and surfaces any exception.
+"""
+import sys
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(_SRC))
+
+
+def test_about_page_renders_without_exception():
+    at = AppTest.from_file(str(_SRC / "pages" / "2_about_app.py"), default_timeout=30)
+    at.run()
+    assert not at.exception